@@ -9,11 +9,45 @@ import json
 import sys
 import signal
 import logging
+import logging.handlers
 import os
+import select
 import subprocess
+import threading
+import time
+import atexit
+import queue
+import struct
+from enum import IntEnum
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from functools import lru_cache
 
+# orjson is optional: same API shape, but a much faster C encoder/decoder.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so decode errors
+# are caught the same way (except that json.loads raises UnicodeDecodeError
+# for bytes that are not valid UTF-8, which orjson reports as a decode error;
+# callers catch both), but the two backends do not accept the same
+# documents: orjson.dumps raises TypeError past 254 nesting levels or on
+# integers wider than 64 bits (the stdlib handles both, so _dumpb retries
+# with it), and orjson.loads turns integers wider than 64 bits into floats
+# where json.loads keeps them exact.
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumpb(obj) -> bytes:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            return json.dumps(obj).encode("utf-8")
+except ImportError:
+    _loads = json.loads
+
+    def _dumpb(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
 # ---------------------------------------------------------------------------
 # 1.  Configuration des chemins vers les agents ADK ----------------------
 # ---------------------------------------------------------------------------
@@ -28,10 +62,15 @@ def get_workspace_root() -> Path:
 
 @lru_cache(maxsize=1)
 def get_agents_config() -> dict:
-    """Build the agents configuration using the current workspace root."""
+    """Build the agents configuration using the current workspace root.
+
+    The workspace root is already user-expanded, so every path built here is
+    final and callers can use it as-is.  ``command`` holds the pre-rendered
+    ``(python, script)`` argv prefix used to spawn the agent.
+    """
 
     workspace = get_workspace_root()
-    return {
+    agents = {
         "label_github_issue": {
             "path": workspace / "github_labeler" / "main.py",
             "python": workspace / "adk-env" / "bin" / "python",
@@ -53,21 +92,91 @@ def get_agents_config() -> dict:
             "description": "Curator Agent for content curation"
         }
     }
+    for agent_config in agents.values():
+        agent_config["command"] = (str(agent_config["python"]), str(agent_config["path"]))
+    return agents
+
+def get_persistent_agents() -> frozenset:
+    """Agents kept warm between calls (ADK_PERSISTENT_AGENTS, comma-separated)."""
+
+    names = os.environ.get("ADK_PERSISTENT_AGENTS", "")
+    return frozenset(name.strip() for name in names.split(",") if name.strip())
+
+# Logging is only set up in section 2: warnings about invalid settings are
+# collected here and logged from there.
+_CONFIG_WARNINGS = []
+
+def get_env_number(name: str, default, cast=int, minimum=1):
+    """Numeric setting from the environment, or ``default`` if unset or invalid.
+
+    A value that does not parse with ``cast`` or is below ``minimum`` is
+    replaced by ``default``, with a warning.
+    """
+
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        value = cast(raw)
+    except ValueError:
+        value = None
+    # "not >=" also rejects NaN
+    if value is None or not value >= minimum:
+        _CONFIG_WARNINGS.append(
+            f"Invalid {name}={raw!r} (expected a number >= {minimum}), using {default}"
+        )
+        return default
+    return value
+
 
 ADK_WORKSPACE = get_workspace_root()
-AGENTS_CONFIG = get_agents_config()
+PERSISTENT_AGENTS = get_persistent_agents()
+AGENT_TIMEOUT = 300  # 5 minutes timeout
+MAX_CONCURRENT_DISPATCHES = get_env_number("ADK_MAX_CONCURRENCY", 4)
+WORKER_IDLE_TIMEOUT = get_env_number("ADK_WORKER_IDLE_TIMEOUT", 600.0, cast=float, minimum=0)
+MAX_PENDING_REQUESTS = get_env_number("ADK_MAX_PENDING_REQUESTS", 64)
+MAX_REQUEST_BYTES = get_env_number("ADK_MAX_REQUEST_BYTES", 16 * 1024 * 1024)
+
+
+class ErrorCode(IntEnum):
+    """Stable ``error_code`` values for errors raised by the bridge itself.
+
+    Clients can branch on these instead of matching ``error`` messages.
+    Errors reported by the agents themselves carry no code.
+    """
+
+    INVALID_REQUEST = 1
+    UNKNOWN_TOOL = 2
+    MISSING_PARAMS = 3
+    REQUEST_TOO_LARGE = 4
+    AGENT_TIMEOUT = 5
+    CANCELLED = 6
 
 # ---------------------------------------------------------------------------
 # 2.  Setup logging --------------------------------------------------------
 # ---------------------------------------------------------------------------
-logging.basicConfig(
-    filename=os.path.expanduser("~/.gemini/bridge.log"),
-    level=logging.INFO,
-    format="[%(asctime)s] %(levelname)s: %(message)s",
+# Records are handed to a background listener thread through a queue, so
+# dispatch threads never block on the log file write.
+_log_file_handler = logging.FileHandler(os.path.expanduser("~/.gemini/bridge.log"))
+_log_file_handler.setFormatter(logging.Formatter("[%(asctime)s] %(levelname)s: %(message)s"))
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, _log_file_handler, respect_handler_level=True
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+_log_queue_handler = logging.handlers.QueueHandler(_log_queue)
+# Layout is applied by the file handler; only render message + traceback here
+_log_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
+logging.basicConfig(level=logging.INFO, handlers=[_log_queue_handler])
 
 logger = logging.getLogger(__name__)
 
+for _warning in _CONFIG_WARNINGS:
+    logger.warning(_warning)
+
 # ---------------------------------------------------------------------------
 # 3.  Agent helpers --------------------------------------------------------
 # ---------------------------------------------------------------------------
@@ -76,9 +185,9 @@ logger = logging.getLogger(__name__)
 def validate_agent(agent_name: str) -> dict:
     """Validate that the agent script and Python interpreter exist."""
 
-    agent_config = AGENTS_CONFIG[agent_name]
-    agent_path = agent_config["path"].expanduser()
-    python_path = agent_config["python"].expanduser()
+    agent_config = get_agents_config()[agent_name]
+    agent_path = agent_config["path"]
+    python_path = agent_config["python"]
 
     issues = []
     if not agent_path.exists():
@@ -95,34 +204,395 @@ def validate_agent(agent_name: str) -> dict:
     }
 
 
+HEALTHCHECK_TTL = 5.0
+# agent_name -> (monotonic timestamp, validate_agent result)
+_HEALTHCHECK_CACHE: dict = {}
+
+
 def healthcheck() -> dict:
-    """Return the validation status for all configured agents."""
+    """Return the validation status for all configured agents.
+
+    Results are reused for ``HEALTHCHECK_TTL`` seconds so that frequent
+    polling does not stat every script and interpreter on each call.
+    """
 
-    return {name: validate_agent(name) for name in AGENTS_CONFIG}
+    now = time.monotonic()
+    report = {}
+    for name in get_agents_config():
+        cached = _HEALTHCHECK_CACHE.get(name)
+        if cached is None or now - cached[0] >= HEALTHCHECK_TTL:
+            cached = (now, validate_agent(name))
+            _HEALTHCHECK_CACHE[name] = cached
+        report[name] = cached[1]
+    return report
 
 
 # ---------------------------------------------------------------------------
 # 4.  Agent execution functions --------------------------------------------
 # ---------------------------------------------------------------------------
 
+def _decode_output(data: bytes) -> str:
+    """Decode raw agent output, normalising newlines like text mode would."""
+
+    return data.decode("utf-8", errors="replace").replace("\r\n", "\n")
+
+
+def _parse_agent_output(stdout: bytes) -> dict:
+    """Turn a successful agent's stdout into a result dict."""
+
+    # isspace() scans in place; strip() would copy the whole output
+    if not stdout or stdout.isspace():
+        return {"status": "success", "output": _decode_output(stdout)}
+    try:
+        return _loads(stdout)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return {"status": "success", "output": _decode_output(stdout)}
+
+
+# Every fd the bridge opens is non-inheritable (PEP 446), so agents can be
+# spawned with close_fds=False, which lets CPython use posix_spawn instead of
+# fork + exec + closing the whole fd table.
+SPAWN_CLOSE_FDS = False
+
+
+# Environment passed to every agent process.  The bridge never changes its
+# own environment, so it is resolved once at startup; subprocess only reads
+# the mapping, so the same dict is shared by every spawn.
+AGENT_ENV = {
+    **os.environ,
+    "PYTHONPATH": str(ADK_WORKSPACE),
+    "ADK_WORKSPACE": str(ADK_WORKSPACE),
+}
+
+
+class StdioUnsupported(RuntimeError):
+    """The agent's first worker exited without ever reading its request."""
+
+
+class AgentWorkerError(RuntimeError):
+    """A persistent worker failed; ``stderr`` holds the tail of its output."""
+
+    def __init__(self, message: str, stderr: str = ""):
+        super().__init__(message)
+        self.stderr = stderr
+
+
+def _pipe_unread(fd: int) -> int:
+    """Bytes written to a pipe that its reader has not consumed yet.
+
+    Returns 0 where FIONREAD is unavailable (fcntl and termios are POSIX-only,
+    so they are imported here rather than at module level).
+    """
+
+    try:
+        import fcntl
+        import termios
+
+        return struct.unpack("i", fcntl.ioctl(fd, termios.FIONREAD, b"\0\0\0\0"))[0]
+    except (ImportError, OSError):
+        return 0
+
+
+class AgentWorkerPool:
+    """Long-lived ``--stdio`` agent processes reused across dispatches.
+
+    A worker reads one JSON line of params on stdin and answers with one JSON
+    object line on stdout; any other line is a protocol error and the worker
+    is replaced.  Workers are started lazily and respawned if they exit; a
+    background reaper stops those idle for longer than ``idle_timeout``
+    seconds.
+    An agent that has never answered and whose worker exits without reading
+    its request line is assumed not to support ``--stdio`` and is no longer
+    started as a worker.
+    """
+
+    STDERR_TAIL_BYTES = 64 * 1024
+
+    def __init__(self, idle_timeout: float = WORKER_IDLE_TIMEOUT):
+        self._workers = {}
+        self._answered = set()
+        self._unsupported = set()
+        self._lock = threading.Lock()
+        self._idle_timeout = idle_timeout
+        self._closed = threading.Event()
+        self._reaper = None
+
+    def supports(self, agent_name: str) -> bool:
+        """False once the agent has shown it has no ``--stdio`` mode."""
+
+        return agent_name not in self._unsupported
+
+    def _get_worker(self, agent_name: str) -> dict:
+        with self._lock:
+            worker = self._workers.get(agent_name)
+            if worker is None or worker["proc"].poll() is not None:
+                worker = self._spawn(agent_name)
+                self._workers[agent_name] = worker
+                if self._reaper is None:
+                    self._reaper = threading.Thread(target=self._reap_idle_workers, daemon=True)
+                    self._reaper.start()
+            # Marked as used before the pool lock is released so it cannot be evicted
+            worker["last_used"] = time.monotonic()
+        return worker
+
+    def _reap_idle_workers(self):
+        """Reaper thread: stop idle workers, even when no request comes in."""
+
+        interval = max(1.0, min(self._idle_timeout, 30.0))
+        while not self._closed.wait(interval):
+            with self._lock:
+                idle = self._pop_idle_workers()
+            for stale in idle:
+                self._stop(stale)
+
+    def _spawn(self, agent_name: str) -> dict:
+        agent_config = get_agents_config()[agent_name]
+        cmd = [*agent_config["command"], "--stdio"]
+        logger.info("Starting persistent worker for %s", agent_name)
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=AGENT_ENV,
+            close_fds=SPAWN_CLOSE_FDS,
+        )
+        # Requests are written with os.write under a deadline, never blocking
+        os.set_blocking(proc.stdin.fileno(), False)
+        worker = {
+            "proc": proc,
+            "lock": threading.Lock(),
+            "buffer": bytearray(),
+            "writes": 0,
+            "answered": False,
+            "stderr": bytearray(),
+            "stderr_lock": threading.Lock(),
+        }
+        worker["stderr_reader"] = threading.Thread(
+            target=self._drain_stderr, args=(worker,), daemon=True
+        )
+        worker["stderr_reader"].start()
+        return worker
+
+    @classmethod
+    def _drain_stderr(cls, worker: dict):
+        """Keep the tail of a worker's stderr so failures can report it."""
+
+        fd = worker["proc"].stderr.fileno()
+        tail = worker["stderr"]
+        while True:
+            try:
+                chunk = os.read(fd, 65536)
+            except OSError:
+                return
+            if not chunk:
+                return
+            with worker["stderr_lock"]:
+                tail += chunk
+                del tail[:-cls.STDERR_TAIL_BYTES]
+
+    @staticmethod
+    def _stderr_tail(worker: dict) -> str:
+        # Called once the worker is dead: let the reader collect its last words
+        worker["stderr_reader"].join(timeout=1)
+        with worker["stderr_lock"]:
+            return _decode_output(bytes(worker["stderr"]))
+
+    def _pop_idle_workers(self) -> list:
+        """Remove and return workers idle past the timeout (pool lock held)."""
+
+        now = time.monotonic()
+        idle = [
+            name for name, worker in self._workers.items()
+            if now - worker["last_used"] > self._idle_timeout and not worker["lock"].locked()
+        ]
+        for name in idle:
+            logger.info("Stopping idle persistent worker for %s", name)
+        return [self._workers.pop(name) for name in idle]
+
+    @staticmethod
+    def _write_line(worker: dict, data: bytes, deadline: float, timeout: float):
+        # A worker that stops reading must not block the dispatch thread
+        # forever once a large params line has filled the pipe
+        proc = worker["proc"]
+        fd = proc.stdin.fileno()
+        view = memoryview(data)
+        while view:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([], [fd], [], remaining)[1]:
+                raise subprocess.TimeoutExpired(proc.args, timeout)
+            try:
+                view = view[os.write(fd, view):]
+            except BlockingIOError:
+                continue
+
+    @staticmethod
+    def _read_line(worker: dict, deadline: float, timeout: float) -> bytes:
+        # Raw reads on the fd so select() sees exactly what is still unread
+        proc, buffer = worker["proc"], worker["buffer"]
+        fd = proc.stdout.fileno()
+        while True:
+            newline = buffer.find(b"\n")
+            if newline != -1:
+                line = bytes(buffer[:newline])
+                del buffer[:newline + 1]
+                return line
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                raise subprocess.TimeoutExpired(proc.args, timeout)
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                # stdout closed does not mean exited: never wait past the deadline
+                returncode = proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+                raise RuntimeError(f"Agent worker exited with code {returncode}")
+            buffer += chunk
+
+    @staticmethod
+    def _parse_answer(line: bytes) -> dict:
+        # Anything but a JSON object (a stray print, a blank line) means the
+        # answer is still to come: trusting the line would shift every later
+        # response by one
+        try:
+            result = _loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            result = None
+        if not isinstance(result, dict):
+            raise RuntimeError(
+                f"Agent worker answered with a line that is not a JSON object: "
+                f"{_decode_output(line[:200])!r}"
+            )
+        return result
+
+    def request(self, agent_name: str, params: dict, timeout: float) -> dict:
+        """Send params to the agent's worker and return its parsed answer.
+
+        Raises ``subprocess.TimeoutExpired`` past ``timeout``,
+        ``StdioUnsupported`` if the agent turns out to have no ``--stdio``
+        mode, and ``AgentWorkerError`` for any other worker failure.
+        """
+
+        worker = self._acquire_worker(agent_name)
+        deadline = time.monotonic() + timeout
+        with worker["stderr_lock"]:
+            worker["stderr"].clear()
+        try:
+            worker["writes"] += 1
+            self._write_line(worker, _dumpb(params) + b"\n", deadline, timeout)
+            result = self._parse_answer(self._read_line(worker, deadline, timeout))
+            worker["answered"] = True
+            self._answered.add(agent_name)
+            return result
+        except (subprocess.TimeoutExpired, RuntimeError, OSError) as e:
+            unsupported = (
+                agent_name not in self._answered
+                and not isinstance(e, subprocess.TimeoutExpired)
+                and self._never_read_request(worker, e)
+            )
+            # The worker is in an unknown state; drop it so the next call respawns
+            self._discard(agent_name, worker)
+            if isinstance(e, subprocess.TimeoutExpired):
+                raise
+            if unsupported:
+                self._unsupported.add(agent_name)
+                raise StdioUnsupported(str(e)) from e
+            raise AgentWorkerError(str(e), self._stderr_tail(worker)) from e
+        finally:
+            worker["last_used"] = time.monotonic()
+            worker["lock"].release()
+
+    def _acquire_worker(self, agent_name: str) -> dict:
+        """Return the agent's worker with its lock held.
+
+        A request that waited on the lock of a worker which failed meanwhile
+        moves on to a fresh worker instead of writing to a dead pipe.  A
+        worker that has not been sent anything yet is used as is, even if it
+        already exited: its first request is how a missing ``--stdio`` mode
+        is detected.
+        """
+
+        while True:
+            worker = self._get_worker(agent_name)
+            worker["lock"].acquire()
+            with self._lock:
+                current = self._workers.get(agent_name) is worker
+            if worker["writes"] == 0 or (current and worker["proc"].poll() is None):
+                return worker
+            worker["lock"].release()
+
+    @staticmethod
+    def _never_read_request(worker: dict, error: Exception) -> bool:
+        """True if the dead worker never consumed a single request line.
+
+        Only a worker whose very first request failed qualifies: a request
+        queued behind another one may find the pipe broken by the request
+        before it.  A request only runs once its whole line has been read, so
+        a broken pipe or bytes still sitting unread in the worker's stdin
+        prove it was never executed; anything else means it may have been.
+        """
+
+        if worker["answered"] or worker["writes"] != 1:
+            return False
+        if isinstance(error, BrokenPipeError):
+            return True
+        return (
+            not worker["buffer"]
+            and worker["proc"].poll() is not None
+            and _pipe_unread(worker["proc"].stdin.fileno()) > 0
+        )
+
+    def _discard(self, agent_name: str, worker: dict):
+        with self._lock:
+            if self._workers.get(agent_name) is worker:
+                del self._workers[agent_name]
+        if worker["proc"].poll() is None:
+            worker["proc"].kill()
+            worker["proc"].wait()
+
+    @staticmethod
+    def _stop(worker: dict):
+        proc = worker["proc"]
+        if proc.poll() is None:
+            proc.stdin.close()
+            proc.terminate()
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+
+    def shutdown(self):
+        """Terminate every worker (registered with atexit)."""
+
+        self._closed.set()
+        with self._lock:
+            workers, self._workers = self._workers, {}
+        for worker in workers.values():
+            self._stop(worker)
+
+
+WORKER_POOL = AgentWorkerPool()
+atexit.register(WORKER_POOL.shutdown)
+
+
 def run_agent_script(agent_name: str, params: dict) -> dict:
     """Execute an ADK agent Python script with parameters."""
     try:
-        agent_config = AGENTS_CONFIG[agent_name]
-        agent_path = agent_config["path"].expanduser()
-        python_path = agent_config["python"].expanduser()
+        agent_config = get_agents_config()[agent_name]
+        agent_path = agent_config["path"]
 
-        validation = validate_agent(agent_name)
-        if validation["issues"]:
-            return {"status": "error", "error": "; ".join(validation["issues"])}
-
-        # Prepare the environment
-        env = os.environ.copy()
-        env["PYTHONPATH"] = str(ADK_WORKSPACE)
-        env["ADK_WORKSPACE"] = str(ADK_WORKSPACE)
+        if agent_name in PERSISTENT_AGENTS and WORKER_POOL.supports(agent_name):
+            try:
+                return WORKER_POOL.request(agent_name, params, timeout=AGENT_TIMEOUT)
+            except StdioUnsupported as e:
+                logger.warning(
+                    "Persistent worker for %s failed (%s), falling back to one process per call",
+                    agent_name, e,
+                )
+            except AgentWorkerError as e:
+                logger.error("Persistent worker for %s failed: %s", agent_name, e)
+                return {"status": "error", "error": e.stderr or str(e)}
 
         # Convert params to command line arguments or JSON input
-        cmd = [str(python_path), str(agent_path)]
+        cmd = [*agent_config["command"]]
         
         # If params contain specific keys, pass them as arguments
         if "issue_number" in params:
@@ -132,46 +602,81 @@ def run_agent_script(agent_name: str, params: dict) -> dict:
         if "dry_run" in params and params["dry_run"]:
             cmd.append("--dry-run")
         
-        # Execute the agent
+        # Execute the agent (binary pipes: JSON is parsed straight from bytes,
+        # text is only decoded when it has to be returned as-is)
         result = subprocess.run(
             cmd,
-            input=json.dumps(params),
-            text=True,
+            input=_dumpb(params),
             capture_output=True,
-            env=env,
-            timeout=300  # 5 minutes timeout
+            env=AGENT_ENV,
+            close_fds=SPAWN_CLOSE_FDS,
+            timeout=AGENT_TIMEOUT
         )
         
         if result.returncode == 0:
-            try:
-                return json.loads(result.stdout) if result.stdout.strip() else {"status": "success", "output": result.stdout}
-            except json.JSONDecodeError:
-                return {"status": "success", "output": result.stdout}
+            return _parse_agent_output(result.stdout)
         else:
+            # Paths are only checked once the run failed (EAFP): a missing
+            # script makes the interpreter exit non-zero
+            validation = validate_agent(agent_name)
+            if validation["issues"]:
+                return {"status": "error", "error": "; ".join(validation["issues"])}
             return {
                 "status": "error", 
-                "error": result.stderr or f"Process failed with code {result.returncode}",
-                "stdout": result.stdout
+                "error": _decode_output(result.stderr) or f"Process failed with code {result.returncode}",
+                "stdout": _decode_output(result.stdout)
             }
             
     except subprocess.TimeoutExpired:
-        return {"status": "error", "error": "Agent execution timed out"}
+        return {
+            "status": "error",
+            "error": "Agent execution timed out",
+            "error_code": ErrorCode.AGENT_TIMEOUT,
+        }
     except FileNotFoundError:
-        return {"status": "error", "error": f"Agent script not found: {agent_path}"}
+        issues = validate_agent(agent_name)["issues"]
+        return {"status": "error", "error": "; ".join(issues) or f"Agent script not found: {agent_path}"}
     except Exception as e:
-        logger.exception(f"Error running agent {agent_path}")
+        logger.exception("Error running agent %s", agent_path)
         return {"status": "error", "error": str(e)}
 
 # ---------------------------------------------------------------------------
 # 4.  Dispatch functions ---------------------------------------------------
 # ---------------------------------------------------------------------------
 
+# Built once and merged into each request's params (tuple values are shared read-only)
+WATCH_COLLECT_DEFAULTS = {
+    "sources": ("github", "pypi", "npm"),
+    "output_format": "markdown"
+}
+CURATE_DIGEST_DEFAULTS = {
+    "format": "newsletter",
+    "output": "markdown"
+}
+LABEL_REQUIRED_PARAMS = frozenset(("repo_name", "issue_number"))
+
+
+def _with_defaults(defaults: dict, params: dict) -> dict:
+    """Fill in missing defaults in place and return params.
+
+    params is owned by the request being dispatched, so it is completed
+    directly instead of being merged into a fresh dict.
+    """
+
+    for key, value in defaults.items():
+        params.setdefault(key, value)
+    return params
+
+
 def dispatch_label_github_issue(params: dict) -> dict:
     """Handle GitHub issue labeling."""
-    required_params = ["repo_name", "issue_number"]
-    missing = [p for p in required_params if p not in params]
+    missing = LABEL_REQUIRED_PARAMS - params.keys()
     if missing:
-        return {"status": "error", "error": f"Missing required parameters: {missing}"}
+        return {
+            "status": "error",
+            "error": f"Missing required parameters: {sorted(missing)}",
+            "error_code": ErrorCode.MISSING_PARAMS,
+        }
     
     # The GitHub labeler automatically determines labels based on content
     # Add dry_run by default to avoid making actual changes unless explicitly requested
@@ -182,29 +687,22 @@ def dispatch_label_github_issue(params: dict) -> dict:
 
 def dispatch_watch_collect(params: dict) -> dict:
     """Handle watch/veille collection."""
-    # Default parameters for watch collection
-    default_params = {
-        "sources": ["github", "pypi", "npm"],
-        "output_format": "markdown"
-    }
-    merged_params = {**default_params, **params}
-    return run_agent_script("watch_collect", merged_params)
+    return run_agent_script("watch_collect", _with_defaults(WATCH_COLLECT_DEFAULTS, params))
 
 def dispatch_analyse_watch_report(params: dict) -> dict:
     """Handle watch report analysis."""
     if "report" not in params and "report_path" not in params:
-        return {"status": "error", "error": "Missing 'report' or 'report_path' parameter"}
+        return {
+            "status": "error",
+            "error": "Missing 'report' or 'report_path' parameter",
+            "error_code": ErrorCode.MISSING_PARAMS,
+        }
     
     return run_agent_script("analyse_watch_report", params)
 
 def dispatch_curate_digest(params: dict) -> dict:
     """Handle content curation."""
-    default_params = {
-        "format": "newsletter",
-        "output": "markdown"
-    }
-    merged_params = {**default_params, **params}
-    return run_agent_script("curate_digest", merged_params)
+    return run_agent_script("curate_digest", _with_defaults(CURATE_DIGEST_DEFAULTS, params))
 
 
 def dispatch_healthcheck(_params: dict) -> dict:
@@ -216,34 +714,45 @@ def dispatch_healthcheck(_params: dict) -> dict:
 # 5.  Main dispatch function -----------------------------------------------
 # ---------------------------------------------------------------------------
 
+DISPATCHERS = {
+    "label_github_issue": dispatch_label_github_issue,
+    "watch_collect": dispatch_watch_collect,
+    "analyse_watch_report": dispatch_analyse_watch_report,
+    "curate_digest": dispatch_curate_digest,
+    "healthcheck": dispatch_healthcheck,
+}
+AVAILABLE_TOOLS = list(DISPATCHERS)
+
+
 def dispatch(tool: str, params: dict = None) -> dict:
     """Main dispatch function for all agents."""
     if params is None:
         params = {}
+    if not isinstance(params, dict):
+        return {
+            "status": "error",
+            "error": "'params' must be a JSON object",
+            "error_code": ErrorCode.INVALID_REQUEST,
+        }
     
-    logger.info(f"Dispatching tool: {tool} with params: {params}")
-    
-    dispatchers = {
-        "label_github_issue": dispatch_label_github_issue,
-        "watch_collect": dispatch_watch_collect,
-        "analyse_watch_report": dispatch_analyse_watch_report,
-        "curate_digest": dispatch_curate_digest,
-        "healthcheck": dispatch_healthcheck,
-    }
+    logger.info("Dispatching tool: %s", tool)
+    # params may hold a whole report; only render them when debugging
+    logger.debug("Params for %s: %s", tool, params)
     
-    if tool not in dispatchers:
-        available_tools = list(dispatchers.keys())
+    handler = DISPATCHERS.get(tool)
+    if handler is None:
         return {
             "status": "error",
-            "error": f"Unknown tool '{tool}'. Available tools: {available_tools}"
+            "error": f"Unknown tool '{tool}'. Available tools: {AVAILABLE_TOOLS}",
+            "error_code": ErrorCode.UNKNOWN_TOOL,
         }
     
     try:
-        result = dispatchers[tool](params)
-        logger.info(f"Tool {tool} completed with status: {result.get('status', 'unknown')}")
+        result = handler(params)
+        logger.info("Tool %s completed with status: %s", tool, result.get("status", "unknown"))
         return result
     except Exception as e:
-        logger.exception(f"Error in dispatch for tool {tool}")
+        logger.exception("Error in dispatch for tool %s", tool)
         return {"status": "error", "error": str(e)}
 
 # ---------------------------------------------------------------------------
@@ -257,10 +766,205 @@ def _signal_handler(_sig, _frm):
 signal.signal(signal.SIGTERM, _signal_handler)
 signal.signal(signal.SIGINT, _signal_handler)
 
+def _reload_handler(_sig, _frm):
+    logger.info("SIGHUP received, clearing healthcheck cache")
+    _HEALTHCHECK_CACHE.clear()
+
+if hasattr(signal, "SIGHUP"):
+    signal.signal(signal.SIGHUP, _reload_handler)
+
+# STDIO mode replaces the SIGTERM/SIGINT handlers with _stop_handler, which
+# only sets this flag: raising SystemExit at an arbitrary bytecode could drop
+# a request between its dispatch and its response, or abort the drain.  The
+# signal also wakes the read loop through signal.set_wakeup_fd().  The main
+# thread then cancels the requests that have not started yet and waits for the
+# running ones; a second signal gets the default handler and ends the process.
+_STOPPING = threading.Event()
+
+def _stop_handler(_sig, _frm):
+    _STOPPING.set()
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    logger.info("Bridge process terminated by signal, cancelling queued requests")
+
 # ---------------------------------------------------------------------------
 # 7.  Main execution -------------------------------------------------------
 # ---------------------------------------------------------------------------
 
+_OUTPUT_LOCK = threading.Lock()
+
+
+def _encode(result: dict) -> bytes:
+    """Serialize one response line; an unencodable result becomes an error."""
+
+    try:
+        return _dumpb(result) + b"\n"
+    except (TypeError, ValueError, RecursionError) as e:
+        logger.error("Could not encode response: %s", e)
+        error = {"status": "error", "error": f"Could not encode response: {e}"}
+        if "request_id" in result:
+            error["request_id"] = result["request_id"]
+        return _dumpb(error) + b"\n"
+
+
+def _write(result: dict, flush: bool = False):
+    """Write one JSON response line to stdout; safe to call from any thread.
+
+    Never raises: a response that cannot be delivered is logged, so the
+    writer thread keeps serving the requests behind it.
+    """
+
+    data = _encode(result)
+    with _OUTPUT_LOCK:
+        try:
+            sys.stdout.buffer.write(data)
+            if flush:
+                sys.stdout.buffer.flush()
+        except (OSError, ValueError) as e:
+            logger.error("Could not write response to stdout: %s", e)
+
+
+def _flush():
+    with _OUTPUT_LOCK:
+        try:
+            sys.stdout.buffer.flush()
+        except (OSError, ValueError) as e:
+            logger.error("Could not flush stdout: %s", e)
+
+
+def _emit(result: dict):
+    """Write and flush one JSON response line."""
+
+    _write(result, flush=True)
+
+
+def _cancelled() -> dict:
+    """Response for a request dropped by a stop signal before it started."""
+
+    return {
+        "status": "error",
+        "error": "Request cancelled: the bridge is stopping",
+        "error_code": ErrorCode.CANCELLED,
+    }
+
+
+def _resolve(future: Future) -> dict:
+    """Return a dispatch future's result, turning crashes into error responses."""
+
+    try:
+        return future.result()
+    except CancelledError:
+        return _cancelled()
+    except Exception as e:
+        logger.exception("Unexpected error in dispatch worker")
+        return {"status": "error", "error": str(e)}
+
+
+def _emit_tagged(future: Future, request_id, slots: threading.Semaphore):
+    """Emit a dispatch result as soon as it is ready, echoing its request_id."""
+
+    try:
+        _emit({**_resolve(future), "request_id": request_id})
+    finally:
+        slots.release()
+
+
+def _write_in_order(pending: queue.Queue, slots: threading.Semaphore):
+    """Writer thread: emit responses in request order until a None sentinel.
+
+    Responses that are already available are written back to back and
+    flushed once; stdout is only flushed before the writer has to wait.
+    Each dispatched request frees its slot once its response is written.
+    """
+
+    while True:
+        try:
+            item = pending.get_nowait()
+        except queue.Empty:
+            _flush()
+            item = pending.get()
+        if item is None:
+            _flush()
+            return
+        if isinstance(item, Future):
+            try:
+                if not item.done():
+                    _flush()
+                _write(_resolve(item))
+            finally:
+                slots.release()
+        else:
+            _write(item)
+
+
+def _iter_request_lines(fd: int, limit: int, wake_fd: int):
+    """Yield raw request lines read from fd, or None for oversized ones.
+
+    Stops at EOF, or once a stop signal has been received (``wake_fd`` is
+    the signal wakeup fd, so a signal interrupts the wait for input).  At
+    most ``limit`` bytes of a line are buffered: the remainder of an
+    oversized line is skipped without ever being parsed.
+    """
+
+    buffer = bytearray()
+    scanned = 0
+    oversized = False
+    while not _STOPPING.is_set():
+        newline = buffer.find(b"\n", scanned)
+        if newline != -1:
+            line = bytes(buffer[:newline + 1])
+            del buffer[:newline + 1]
+            scanned = 0
+            if oversized or newline > limit:
+                oversized = False
+                yield None
+            else:
+                yield line
+            continue
+        scanned = len(buffer)
+        if scanned > limit:
+            oversized = True
+            buffer.clear()
+            scanned = 0
+        readable = select.select([fd, wake_fd], [], [])[0]
+        if wake_fd in readable:
+            os.read(wake_fd, 512)
+            continue
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            if oversized:
+                yield None
+            elif buffer:
+                yield bytes(buffer)
+            return
+        buffer += chunk
+
+
+def _acquire_slot(slots: threading.Semaphore) -> bool:
+    """Wait for a free request slot; False if a stop signal arrives first."""
+
+    while not slots.acquire(timeout=0.5):
+        if _STOPPING.is_set():
+            return False
+    return True
+
+
+def _drain(inflight: set):
+    """Wait for the dispatched requests, cancelling queued ones on a stop signal.
+
+    ``inflight`` holds the futures that are not done yet (each removes itself
+    when it completes).  A cancelled future is answered through its usual path
+    with a CANCELLED error; only the requests already running are waited for.
+    """
+
+    while inflight:
+        futures = list(inflight)
+        if _STOPPING.is_set():
+            for future in futures:
+                future.cancel()
+        wait(futures, timeout=0.5)
+
+
 def main():
     logger.info("Bridge started")
     
@@ -270,53 +974,121 @@ def main():
         params_json = sys.argv[2] if len(sys.argv) > 2 else "{}"
         
         try:
-            params = json.loads(params_json)
+            params = _loads(params_json)
             result = dispatch(tool_name, params)
-            print(json.dumps(result), flush=True)
+            _emit(result)
         except json.JSONDecodeError as e:
-            error_result = {"status": "error", "error": f"Invalid JSON parameters: {e}"}
-            print(json.dumps(error_result), flush=True)
+            error_result = {
+                "status": "error",
+                "error": f"Invalid JSON parameters: {e}",
+                "error_code": ErrorCode.INVALID_REQUEST,
+            }
+            _emit(error_result)
         except Exception as e:
             error_result = {"status": "error", "error": str(e)}
-            print(json.dumps(error_result), flush=True)
+            _emit(error_result)
         
         return
 
     # STDIO mode for Gemini CLI / Claude Code
     logger.info("Entering STDIO mode")
+
+    # Requests are dispatched concurrently. Responses keep request order,
+    # except for payloads carrying a "request_id", which are answered as soon
+    # as they complete (with the id echoed back). At most MAX_PENDING_REQUESTS
+    # requests are in flight; past that, stdin is not read until one of them
+    # has been answered.
+    executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_DISPATCHES)
+    slots = threading.BoundedSemaphore(MAX_PENDING_REQUESTS)
+    inflight = set()
+    pending = queue.Queue()
+    writer = threading.Thread(target=_write_in_order, args=(pending, slots), daemon=True)
+    writer.start()
+
+    wake_r, wake_w = os.pipe()
+    os.set_blocking(wake_w, False)
+    signal.set_wakeup_fd(wake_w)
+    signal.signal(signal.SIGTERM, _stop_handler)
+    signal.signal(signal.SIGINT, _stop_handler)
     
     try:
-        for line_num, line in enumerate(sys.stdin, 1):
-            line = line.strip()
-            if not line:
+        lines = _iter_request_lines(sys.stdin.fileno(), MAX_REQUEST_BYTES, wake_r)
+        for line_num, line in enumerate(lines, 1):
+            if line is None:
+                logger.error("Request on line %d exceeds %d bytes", line_num, MAX_REQUEST_BYTES)
+                pending.put({
+                    "status": "error",
+                    "error": f"Request on line {line_num} exceeds {MAX_REQUEST_BYTES} bytes",
+                    "error_code": ErrorCode.REQUEST_TOO_LARGE,
+                })
+                continue
+            # JSON parsers accept surrounding whitespace; no need to strip a copy
+            if line.isspace():
                 continue
                 
             try:
-                payload = json.loads(line)
+                payload = _loads(line)
+                if not isinstance(payload, dict):
+                    pending.put({
+                        "status": "error",
+                        "error": f"Request on line {line_num} is not a JSON object",
+                        "error_code": ErrorCode.INVALID_REQUEST,
+                    })
+                    continue
                 tool = payload.get("tool")
                 params = payload.get("params", {})
+                request_id = payload.get("request_id")
                 
-                if not tool:
-                    result = {"status": "error", "error": "Missing 'tool' in payload"}
+                if not tool or not isinstance(tool, str):
+                    result = {
+                        "status": "error",
+                        "error": "'tool' must be a string" if tool else "Missing 'tool' in payload",
+                        "error_code": ErrorCode.INVALID_REQUEST,
+                    }
+                    if request_id is not None:
+                        result["request_id"] = request_id
+                    pending.put(result)
+                    continue
+
+                if not _acquire_slot(slots):
+                    result = _cancelled()
+                    if request_id is not None:
+                        result["request_id"] = request_id
+                    pending.put(result)
+                    continue
+                future = executor.submit(dispatch, tool, params)
+                inflight.add(future)
+                future.add_done_callback(inflight.discard)
+                if request_id is None:
+                    pending.put(future)
                 else:
-                    result = dispatch(tool, params)
-                
-                print(json.dumps(result), flush=True)
+                    future.add_done_callback(
+                        lambda f, rid=request_id: _emit_tagged(f, rid, slots)
+                    )
                 
-            except json.JSONDecodeError as e:
-                logger.error(f"JSON decode error on line {line_num}: {e}")
-                error_result = {"status": "error", "error": f"Invalid JSON on line {line_num}: {e}"}
-                print(json.dumps(error_result), flush=True)
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                logger.error("JSON decode error on line %d: %s", line_num, e)
+                pending.put({
+                    "status": "error",
+                    "error": f"Invalid JSON on line {line_num}: {e}",
+                    "error_code": ErrorCode.INVALID_REQUEST,
+                })
             except Exception as e:
-                logger.exception(f"Unexpected error on line {line_num}")
-                error_result = {"status": "error", "error": str(e)}
-                print(json.dumps(error_result), flush=True)
+                logger.exception("Unexpected error on line %d", line_num)
+                pending.put({"status": "error", "error": str(e)})
                 
-    except KeyboardInterrupt:
-        logger.info("Bridge interrupted by user")
     except Exception as e:
         logger.exception("Fatal error in STDIO loop")
     finally:
+        # Let in-flight dispatches finish and flush their responses; after a
+        # stop signal, only the ones already running are waited for
+        _drain(inflight)
+        executor.shutdown(wait=True)
+        pending.put(None)
+        writer.join()
+        signal.set_wakeup_fd(-1)
+        os.close(wake_r)
+        os.close(wake_w)
         logger.info("Bridge stopped")
 
 if __name__ == "__main__":
@@ -0,0 +1,172 @@
+"""End-to-end tests for the bridge's STDIO mode.
+
+Each test runs bridge.py in a subprocess against a throwaway workspace whose
+watch_collect agent is a small stub (see STUB_AGENT), with HOME pointing to a
+temporary directory so the log file stays out of the real ~/.gemini.
+
+Run with: python -m unittest discover tests
+"""
+import json
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+BRIDGE = Path(__file__).resolve().parent.parent / "bridge.py"
+
+# Answers {"status": "success", "pid", "mode", "n"} for each request, either
+# once (per-call mode, JSON on stdin) or per line (--stdio).  "started" names a
+# file to create on arrival, "sleep" delays the answer, "crash" kills the
+# process without answering.
+STUB_AGENT = """\
+import json, os, sys, time
+
+def answer(params, mode):
+    if params.get("started"):
+        open(params["started"], "w").close()
+    time.sleep(params.get("sleep", 0))
+    if params.get("crash"):
+        os._exit(1)
+    return {"status": "success", "pid": os.getpid(), "mode": mode, "n": params.get("n")}
+
+if "--stdio" in sys.argv:
+    for line in sys.stdin:
+        print(json.dumps(answer(json.loads(line), "stdio")), flush=True)
+else:
+    print(json.dumps(answer(json.load(sys.stdin), "spawn")))
+"""
+
+
+def request(n, request_id=None, **params):
+    payload = {"tool": "watch_collect", "params": {"n": n, **params}}
+    if request_id is not None:
+        payload["request_id"] = request_id
+    return json.dumps(payload) + "\n"
+
+
+class BridgeStdioTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+        (self.tmp / "home" / ".gemini").mkdir(parents=True)
+        agent = self.tmp / "workspace" / "veille_agent"
+        (agent / ".venv" / "bin").mkdir(parents=True)
+        (agent / ".venv" / "bin" / "python").symlink_to(sys.executable)
+        (agent / "main.py").write_text(STUB_AGENT)
+        self.env = {
+            **os.environ,
+            "HOME": str(self.tmp / "home"),
+            "ADK_WORKSPACE": str(self.tmp / "workspace"),
+            "ADK_PERSISTENT_AGENTS": "",
+        }
+
+    def start(self, **env):
+        proc = subprocess.Popen(
+            [sys.executable, "-u", str(BRIDGE)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env={**self.env, **env},
+            text=True,
+        )
+        self.addCleanup(proc.kill)
+        self.addCleanup(proc.stdout.close)
+        return proc
+
+    def send(self, proc, *lines):
+        proc.stdin.write("".join(lines))
+        proc.stdin.flush()
+
+    def finish(self, proc, close_stdin=True):
+        if close_stdin:
+            proc.stdin.close()
+        out = proc.stdout.read()
+        self.assertEqual(proc.wait(timeout=10), 0)
+        if not close_stdin:
+            proc.stdin.close()
+        return [json.loads(line) for line in out.splitlines()]
+
+    def wait_for(self, path, timeout=10):
+        deadline = time.monotonic() + timeout
+        while not path.exists():
+            self.assertLess(time.monotonic(), deadline, f"{path} never appeared")
+            time.sleep(0.02)
+
+    def test_ordered_responses_and_request_id_echo(self):
+        proc = self.start(ADK_MAX_CONCURRENCY="4")
+        self.send(
+            proc,
+            request(1, sleep=0.5),
+            request(2),
+            request(3, request_id="tagged"),
+        )
+        responses = self.finish(proc)
+
+        # The tagged request does not wait for the slow one ahead of it
+        self.assertEqual(responses[0]["request_id"], "tagged")
+        self.assertEqual(responses[0]["n"], 3)
+        self.assertEqual([r["n"] for r in responses[1:]], [1, 2])
+        self.assertTrue(all("request_id" not in r for r in responses[1:]))
+
+    def test_oversized_line_is_rejected_and_reading_goes_on(self):
+        proc = self.start(ADK_MAX_REQUEST_BYTES="128")
+        self.send(proc, request(1, padding="x" * 512), request(2))
+        responses = self.finish(proc)
+
+        self.assertEqual(len(responses), 2)
+        self.assertEqual(responses[0]["status"], "error")
+        self.assertEqual(responses[0]["error_code"], 4)
+        self.assertEqual(responses[1]["status"], "success")
+        self.assertEqual(responses[1]["n"], 2)
+
+    def test_stop_signal_cancels_queued_requests(self):
+        started = self.tmp / "started"
+        proc = self.start(ADK_MAX_CONCURRENCY="1")
+        self.send(
+            proc,
+            request(1, sleep=1, started=str(started)),
+            request(2, sleep=5),
+            request(3, request_id="queued", sleep=5),
+        )
+        self.wait_for(started)
+        began = time.monotonic()
+        proc.send_signal(signal.SIGTERM)
+        responses = self.finish(proc, close_stdin=False)
+
+        # Only the running request is waited for
+        self.assertLess(time.monotonic() - began, 4)
+        self.assertEqual(len(responses), 3)
+        ordered = [r for r in responses if "request_id" not in r]
+        self.assertEqual(ordered[0]["status"], "success")
+        self.assertEqual(ordered[0]["n"], 1)
+        self.assertEqual(ordered[1]["error_code"], 6)
+        tagged = next(r for r in responses if "request_id" in r)
+        self.assertEqual(tagged["request_id"], "queued")
+        self.assertEqual(tagged["error_code"], 6)
+
+    def test_queued_request_survives_a_persistent_worker_crash(self):
+        proc = self.start(ADK_PERSISTENT_AGENTS="watch_collect", ADK_MAX_CONCURRENCY="2")
+        self.send(proc, request(0))
+        warm = json.loads(proc.stdout.readline())
+        self.assertEqual(warm["mode"], "stdio")
+
+        # The second request queues on the worker while the first one crashes it
+        self.send(proc, request(1, request_id="crash", crash=True, sleep=0.5))
+        time.sleep(0.1)
+        self.send(proc, request(2, request_id="queued"))
+        responses = {r["request_id"]: r for r in self.finish(proc)}
+
+        self.assertEqual(responses["crash"]["status"], "error")
+        queued = responses["queued"]
+        self.assertEqual(queued["status"], "success")
+        # Served by a fresh persistent worker, not by the per-call fallback
+        self.assertEqual(queued["mode"], "stdio")
+        self.assertNotEqual(queued["pid"], warm["pid"])
+
+
+if __name__ == "__main__":
+    unittest.main()